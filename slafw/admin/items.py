@@ -474,8 +474,9 @@ class AdminLabel(AdminTextValue):
         return self._label_value
 
     def set(self, value: str):
-        self._label_value = value
-        self.changed.emit()
+        if self._label_value != value:
+            self._label_value = value
+            self.changed.emit()
 
 
 class AdminSelectionValue(AdminValue):
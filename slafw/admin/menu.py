@@ -5,9 +5,10 @@
 import logging
 from pathlib import Path
 from collections import OrderedDict
-from typing import Dict, List, Optional, Iterable, Callable
+from typing import Dict, List, Optional, Iterable, Iterator, Callable
 from functools import partial
 from glob import iglob
+from itertools import chain
 
 from PySignal import Signal
 
@@ -22,6 +23,16 @@ from slafw.admin.items import (
 )
 
 
+def glob_files(path: Path, filters: List[str]) -> Iterator[str]:
+    """
+    Lazily yield names of files matching the glob filters relative to path
+    """
+#    files = chain.from_iterable(iglob(f, root_dir=path, recursive=True) for f in filters) # TODO python 3.10
+    files = chain.from_iterable(iglob(str(path / f), recursive=True) for f in filters)
+    cut_off = len(str(path))+1
+    return (file[cut_off:] for file in files)
+
+
 class AdminMenu(AdminMenuBase):
     def __init__(self, control: AdminControl, printer: Printer=None):
         self.logger = logging.getLogger(__name__)
@@ -69,10 +80,8 @@ class AdminMenu(AdminMenuBase):
         self.items_changed.emit()
 
     def list_files(self, path: Path, filters: List[str], callback: Callable, icon):
-        all_files: List[str] = []
-        for f in filters:
-#            all_files.extend(iglob(f, root_dir=path, recursive=True)) # TODO python 3.10
-            all_files.extend(iglob(str(path / f), recursive=True))
-        cut_off = len(str(path))+1
-        for file in all_files:
-            self.add_item(AdminAction(file[cut_off:], partial(callback, path, file[cut_off:]), icon))
+        self.add_files(path, glob_files(path, filters), callback, icon)
+
+    def add_files(self, path: Path, names: Iterable[str], callback: Callable, icon):
+        # Announce the whole listing at once, every items_changed re-publishes all the menu items
+        self.add_items(AdminAction(name, partial(callback, path, name), icon) for name in names)
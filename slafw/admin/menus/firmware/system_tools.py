@@ -2,7 +2,7 @@
 # Copyright (C) 2021-2022 Prusa Development a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 
 import pydbus
@@ -34,13 +34,28 @@ from slafw.state_actions.examples import Examples
 from slafw.hardware.printer_model import PrinterModel
 
 
+@lru_cache(maxsize=None)
+def _system_bus_proxy(bus_name: str):
+    # Introspecting the remote object is a DBus round-trip, reuse the proxy across menu re-entries
+    return pydbus.SystemBus().get(bus_name)
+
+
 class SystemToolsMenu(SafeAdminMenu):
     SYSTEMD_DBUS = ".systemd1"
+    EXAMPLES_PROGRESS = {
+        "download_progress": "Downloading examples",
+        "unpack_progress": "Unpacking examples",
+        "copy_progress": "Copying examples",
+    }
 
     def __init__(self, control: AdminControl, printer: Printer):
         super().__init__(control)
         self._printer = printer
-        self.systemd = pydbus.SystemBus().get(self.SYSTEMD_DBUS)
+        self.systemd = _system_bus_proxy(self.SYSTEMD_DBUS)
+        self._unit_enabled = {
+            enable_file: enable_file.exists()
+            for enable_file in (defines.ssh_service_enabled, defines.serial_service_enabled)
+        }
 
         self.add_back()
         self.add_items(
@@ -79,20 +94,17 @@ class SystemToolsMenu(SafeAdminMenu):
                     defines.factory_enable.unlink()
                 # On factory disable, disable also ssh and serial to ensure
                 # end users do not end up with serial, ssh enabled.
-                if defines.ssh_service_enabled.exists():
-                    defines.ssh_service_enabled.unlink()
-                if defines.serial_service_enabled.exists():
-                    defines.serial_service_enabled.unlink()
+                for enable_file in self._unit_enabled:
+                    enable_file.unlink(missing_ok=True)
+                    self._unit_enabled[enable_file] = False
 
         self._printer.runtime_config.factory_mode = value
         if value:
-            self.systemd.Reload()
-            self._systemd_enable_service(defines.serial_service_service)
-            self._systemd_enable_service(defines.ssh_service_service)
+            self._systemd_enable_service(defines.serial_service_service, defines.ssh_service_service)
 
     @property
     def ssh(self) -> bool:
-        return defines.ssh_service_enabled.exists()
+        return self._unit_enabled[defines.ssh_service_enabled]
 
     @ssh.setter
     def ssh(self, value: bool):
@@ -102,7 +114,7 @@ class SystemToolsMenu(SafeAdminMenu):
 
     @property
     def serial(self) -> bool:
-        return defines.serial_service_enabled.exists()
+        return self._unit_enabled[defines.serial_service_enabled]
 
     @serial.setter
     def serial(self, value: bool):
@@ -114,18 +126,21 @@ class SystemToolsMenu(SafeAdminMenu):
         if state:
             with FactoryMountedRW():
                 enable_file.touch()
+                self._unit_enabled[enable_file] = state
             self._systemd_enable_service(service)
         else:
             with FactoryMountedRW():
                 enable_file.unlink()
+                self._unit_enabled[enable_file] = state
             self._systemd_disable_service(service)
 
-    def _systemd_enable_service(self, service: str):
-        state = self.systemd.GetUnitFileState(service)
-        if state == "masked":
-            self.systemd.UnmaskUnitFiles([service], False)
+    def _systemd_enable_service(self, *services: str):
+        masked = [service for service in services if self.systemd.GetUnitFileState(service) == "masked"]
+        if masked:
+            self.systemd.UnmaskUnitFiles(masked, False)
         self.systemd.Reload()
-        self.systemd.StartUnit(service, "replace")
+        for service in services:
+            self.systemd.StartUnit(service, "replace")
 
     def _systemd_disable_service(self, service: str):
         self.systemd.Reload()
@@ -162,14 +177,25 @@ class SystemToolsMenu(SafeAdminMenu):
         self.enter(Wait(self._control, self._do_download_examples))
 
     def _do_download_examples(self, status: AdminLabel):
+        self._fetch_examples(status, self._printer.hw.printer_model)
+
+    def _fetch_examples(self, status: AdminLabel, printer_model: PrinterModel) -> bool:
         status.set("Downloading examples")
-        examples = Examples(self._printer.inet, self._printer.hw.printer_model)
+        examples = Examples(self._printer.inet, printer_model)
+
+        def report_progress(key: str, value):
+            if key in self.EXAMPLES_PROGRESS:
+                status.set(f"{self.EXAMPLES_PROGRESS[key]} {value:.0%}")
+
+        examples.change.connect(report_progress)
         examples.start()
         examples.join()
         if examples.exception:
             self._control.enter(
                 Error(self._control, text=str(examples.exception), headline="Failed to download examples", pop=2)
             )
+            return False
+        return True
 
     def _switch_m1(self):
         self.enter(Wait(self._control, self._do_switch_m1))
@@ -230,14 +256,7 @@ class SystemToolsMenu(SafeAdminMenu):
             )
             return
         # new examples remove the old ones
-        status.set("Downloading examples")
-        examples = Examples(self._printer.inet, printer_model)
-        examples.start()
-        examples.join()
-        if examples.exception:
-            self._control.enter(
-                Error(self._control, text=str(examples.exception), headline="Failed to download examples", pop=2)
-            )
+        if not self._fetch_examples(status, printer_model):
             return
         shut_down(self._printer.hw, reboot=True)
 
@@ -2,7 +2,8 @@
 # Copyright (C) 2022-2024 Prusa Development a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Collection, Optional
+from functools import lru_cache, partial
+from typing import Callable, Collection, Optional, Tuple
 from pathlib import Path
 from time import sleep
 import re
@@ -21,7 +22,7 @@ from slafw.admin.items import (
     AdminFixedValue,
 )
 from slafw.admin.safe_menu import SafeAdminMenu
-from slafw.admin.menu import AdminMenu
+from slafw.admin.menu import AdminMenu, glob_files
 from slafw.admin.menus.dialogs import Info, Error
 from slafw.hardware.axis import Axis
 from slafw.hardware.tower import MovingProfilesTower
@@ -72,8 +73,9 @@ class Profiles(SafeAdminMenu):
             raise NoExternalStorage()
         model_name = self._printer.hw.printer_model.name    # type: ignore[attr-defined]
         fn = f"{self._pset.name.replace(' ', '_')}-{model_name}.{get_export_file_name(self._printer.hw)}.json"
-        usb_remount(str(save_path / fn))
-        self._pset.write_factory(save_path / fn, nondefault=True)
+        target = save_path / fn
+        usb_remount(str(target))
+        self._pset.write_factory(target, nondefault=True)
         self._control.enter(Info(self._control, headline=f"{self._pset.name.capitalize()} saved to:", text=fn))
 
     @SafeAdminMenu.safe_call
@@ -96,14 +98,14 @@ class EditProfiles(AdminMenu):
         else:
             icon = ""
         for profile in pset:
-            yield AdminAction(pretty_name(profile.name), self._get_callback(printer, pset, profile, axis), icon)
+            yield AdminAction(pretty_name(profile.name), partial(self._edit_profile, printer, pset, profile, axis), icon)
 
-    def _get_callback(self,
+    def _edit_profile(self,
             printer: Printer,
             pset: ProfileSet,
             profile: SingleProfile,
             axis: Optional[Axis] = None):
-        return lambda: self._control.enter(EditProfileItems(self._control, printer, pset, profile, axis))
+        self._control.enter(EditProfileItems(self._control, printer, pset, profile, axis))
 
 
 class EditProfileItems(SafeAdminMenu):
@@ -121,8 +123,10 @@ class EditProfileItems(SafeAdminMenu):
         self._profile = profile
         self._temp_profile = None
         self._temp = profile.get_writer()
+        self._axis_moves: Optional[Callable[[], None]] = None
         self.add_back()
         if isinstance(self._pset, (MovingProfilesTilt, MovingProfilesTower)):
+            self._axis_moves = getattr(control, f"{axis.name}_moves")
             self.add_items(
                 (
                     AdminAction("Test profile", self.test_profile, "touchscreen-icon"),
@@ -159,9 +163,9 @@ class EditProfileItems(SafeAdminMenu):
         self._temp_profile.idx = -1
         for val in self._temp_profile.get_values().values():
             val.set_value(self._temp_profile, getattr(self._temp, val.key))
-        if isinstance(self._pset, (MovingProfilesTilt, MovingProfilesTower)):
+        if self._axis_moves:
             self._axis.actual_profile = self._temp_profile
-            getattr(self._control, f"{self._axis.name}_moves")()
+            self._axis_moves()
         else:
             raise RuntimeError(f"Unknown profiles type: {type(self._pset)}")
 
@@ -196,6 +200,12 @@ class EditProfileItems(SafeAdminMenu):
                 hw.tower.move(tower_position)
 
 
+@lru_cache(maxsize=None)
+def internal_profile_files(basename: str) -> Tuple[str, ...]:
+    # dataPath is read-only and changes only with a firmware update, which restarts the process
+    return tuple(glob_files(Path(dataPath), [f"**/*{basename}*.json"]))
+
+
 class ImportProfiles(SafeAdminMenu):
     def __init__(self, control: AdminControl, pset: ProfileSet):
         super().__init__(control)
@@ -209,7 +219,7 @@ class ImportProfiles(SafeAdminMenu):
             self.add_label("<b>USB</b>", "usb_color")
             self.list_files(usb_path, [f"**/*{basename}*.json"], self._import_profile, "usb_color")
         self.add_label("<b>Internal</b>", "factory_color")
-        self.list_files(Path(dataPath), [f"**/*{basename}*.json"], self._import_profile, "factory_color")
+        self.add_files(Path(dataPath), internal_profile_files(basename), self._import_profile, "factory_color")
 
     @SafeAdminMenu.safe_call
     def _import_profile(self, path: Path, name: str):
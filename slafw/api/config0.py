@@ -6,7 +6,8 @@
 from __future__ import annotations
 
 import functools
-from typing import Any, Dict
+from threading import Lock
+from typing import Any, Dict, Optional
 from typing import TYPE_CHECKING
 
 from pydbus.generic import signal
@@ -26,21 +27,12 @@ def wrap_hw_config(cls: Config0):
     :param cls: Target class, Has to be config compatible
     :return: Modified class with properties added
     """
-    for val in vars(HwConfig):
-        if val.startswith("raw_"):
+    for name, prop in vars(HwConfig).items():
+        if name.startswith("raw_") or not isinstance(prop, property):
             continue
 
-        if not isinstance(getattr(HwConfig, val), property):
-            continue
-
-        def func():
-            pass
-
-        func.__name__ = val
-        setattr(cls, val, auto_dbus(wrap_property()(func)))
-        if val not in cls.CHANGED_MAP:
-            cls.CHANGED_MAP[val] = set()
-        cls.CHANGED_MAP[val].add(val)
+        setattr(cls, name, auto_dbus(_map_property(name, name, prop)))
+        cls.CHANGED_MAP.setdefault(name, set()).add(name)
     return cls
 
 
@@ -59,25 +51,34 @@ def wrap_property(func_name=None):
             name = func_name
         f = getattr(HwConfig, name)
         assert isinstance(f, property)
+        return _map_property(func.__name__, name, f)
 
-        @functools.wraps(f.fget)
-        def getter(self):
-            return getattr(self.config, name)
+    return decor
 
-        getter.__name__ = func.__name__
-        getter.__doc__ = f.__doc__
 
-        if f.fset:
-            @functools.wraps(f.fset)
-            def setter(self, value):
-                attr = getattr(self.config, name)
-                setattr(self.config, name, type(attr)(value))
+def _map_property(attr_name: str, name: str, f: property) -> property:
+    """
+    Create property named attr_name mapping to HwConfig property f named name
 
-            return property(fget=getter, fset=setter)
+    The getter and setter keep the HwConfig annotations, these are used to generate the DBus signature.
+    """
 
-        return property(fget=getter)
+    @functools.wraps(f.fget)
+    def getter(self):
+        return getattr(self.config, name)
 
-    return decor
+    getter.__name__ = attr_name
+    getter.__doc__ = f.__doc__
+
+    if f.fset:
+        @functools.wraps(f.fset)
+        def setter(self, value):
+            attr = getattr(self.config, name)
+            setattr(self.config, name, type(attr)(value))
+
+        return property(fget=getter, fset=setter)
+
+    return property(fget=getter)
 
 
 @dbus_api
@@ -92,11 +93,16 @@ class Config0:
     """
 
     __INTERFACE__ = "cz.prusa3d.sl1.config0"
+    # __weakref__ is required by HwConfig.add_onchange_handler, it keeps the handler as a WeakMethod
+    __slots__ = ("config", "_constraints", "_changed", "_changed_lock", "__weakref__")
 
     PropertiesChanged = signal()
 
     def __init__(self, config: HwConfig):
         self.config = config
+        self._constraints: Optional[Dict[str, Any]] = None
+        self._changed: Dict[str, Any] = {}
+        self._changed_lock = Lock()
         self.config.add_onchange_handler(self._on_change)
 
     @auto_dbus
@@ -129,12 +135,17 @@ class Config0:
 
         :return: Config settings constraints as dictionary
         """
-        values = self.config.get_values()
-        return wrap_dict_data_recursive({
-            name: self._process_value(value)
-            for name, value in values.items()
-            if not name.startswith("raw_") and self._process_value(value)
-        })
+        if self._constraints is None:
+            # Constraints are defined by the config values, these do not change at runtime
+            constraints = {}
+            for name, value in self.config.get_values().items():
+                if name.startswith("raw_"):
+                    continue
+                processed = self._process_value(value)
+                if processed:
+                    constraints[name] = processed
+            self._constraints = wrap_dict_data_recursive(constraints)
+        return self._constraints
 
     @staticmethod
     def _process_value(value: Value):
@@ -151,9 +162,20 @@ class Config0:
         return ret
 
     def _on_change(self, key: str, _: Any):
-        if key in self.CHANGED_MAP:
+        if key not in self.CHANGED_MAP:
+            return
+        with self._changed_lock:
+            # The flush is queued behind the callbacks of the same config commit, it announces all of them at once
+            if not self._changed:
+                self.config.schedule_callback(self._flush_changed)
             for changed in self.CHANGED_MAP[key]:
-                self.PropertiesChanged(self.__INTERFACE__, {changed: getattr(self.config, changed)}, [])
+                self._changed[changed] = getattr(self.config, changed)
+
+    def _flush_changed(self):
+        with self._changed_lock:
+            changed, self._changed = self._changed, {}
+        if changed:
+            self.PropertiesChanged(self.__INTERFACE__, changed, [])
 
     CHANGED_MAP = {
         "screwMm": {"microStepsMM"},
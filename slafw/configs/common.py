@@ -132,14 +132,16 @@ class ValueConfigCommon(ValueConfig):
         :param data: dict to import
         :param factory: Whenever to read factory configuration
         """
-        self._fill_from_dict(self, self._values.values(), data, factory, defaults)
+        # The caller keeps the dict, do not let the config share mutable values with it
+        self._fill_from_dict(self, self._values.values(), deepcopy(data), factory, defaults)
 
     def _fill_from_dict(
         # pylint: disable=too-many-arguments
         # pylint: disable=too-many-branches
         self, container, values: list, data: dict, factory: bool = False, defaults: bool = False
     ) -> None:
-        processed_data = deepcopy(data)
+        # Data are either freshly parsed or already copied by read_dict, a shallow copy is enough for key removal
+        processed_data = dict(data)
         for val in values:
             try:
                 key = None
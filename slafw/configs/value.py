@@ -560,7 +560,13 @@ class ValueConfig(BaseConfig):
                 deref_handler = handler
             if not deref_handler:
                 continue
-            self._stored_callbacks.put(functools.partial(deref_handler, key, value))
+            self.schedule_callback(functools.partial(deref_handler, key, value))
+
+    def schedule_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Queue callback to run after the already scheduled ones, from the same run_stored_callbacks pass
+        """
+        self._stored_callbacks.put(callback)
 
     def run_stored_callbacks(self) -> None:
         while not self._stored_callbacks.empty():
@@ -4,7 +4,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import inspect
-from typing import Collection, Tuple
+from functools import lru_cache
+from typing import Collection, Dict, Tuple
 
 from slafw.errors import errors, warnings
 from slafw.motion_controller.trace import Trace
@@ -89,10 +90,11 @@ IGNORED_ARGS = {"self", "args", "kwargs"}
 
 def get_classes(get_errors: bool = False, get_warnings: bool = False) -> Collection[Tuple[str, Exception]]:
     classes = []
+    # Sorted by name within each module, same order as inspect.getmembers without its per-member getattr
     if get_errors:
-        classes.extend(inspect.getmembers(errors))
+        classes.extend(sorted(vars(errors).items()))
     if get_warnings:
-        classes.extend(inspect.getmembers(warnings))
+        classes.extend(sorted(vars(warnings).items()))
 
     for name, cls in classes:
         if not isinstance(cls, type):
@@ -104,14 +106,29 @@ def get_classes(get_errors: bool = False, get_warnings: bool = False) -> Collect
         yield name, cls
 
 
-def get_instance(cls):
+@lru_cache(maxsize=None)
+def _fake_args(cls) -> Tuple:
     parameters = inspect.signature(cls.__init__).parameters
-    args = [FAKE_ARGS[str(param)] for name, param in parameters.items() if name not in IGNORED_ARGS]
-    return cls(*args)
+    return tuple(FAKE_ARGS[str(param)] for name, param in parameters.items() if name not in IGNORED_ARGS)
 
 
-def get_instance_by_code(code: str):
+def get_instance(cls):
+    return cls(*_fake_args(cls))
+
+
+@lru_cache(maxsize=1)
+def _classes_by_code() -> Dict[str, type]:
+    classes: Dict[str, type] = {}
     for _, cls in get_classes(get_errors=True, get_warnings=True):
-        if getattr(cls, "CODE", None).code == code:
-            return get_instance(cls)
-    raise ValueError(f"Unknown exception code to inject {code}")
+        code = getattr(cls, "CODE", None)
+        if code is not None:
+            # First match wins, same as the original linear search
+            classes.setdefault(code.code, cls)
+    return classes
+
+
+def get_instance_by_code(code: str):
+    cls = _classes_by_code().get(code)
+    if cls is None:
+        raise ValueError(f"Unknown exception code to inject {code}")
+    return get_instance(cls)
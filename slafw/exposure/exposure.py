@@ -145,7 +145,7 @@ class ProjectDataCheck(ExposureCheckRunner):
         await asyncio.sleep(0)
         if Path(self.expo.project.data.path).parent != defines.previousPrints:
             self.logger.debug("Running disk cleanup")
-            remove_files(self.logger, list(defines.previousPrints.glob("*")))
+            remove_files(self.logger, defines.previousPrints.glob("*"))
         await asyncio.sleep(0)
         self.logger.debug("Running project copy and check")
         self.expo.project.copy_and_check()
@@ -402,7 +402,7 @@ class Exposure:
         if self.state in cancelable_states:
             self.cancel()
         else:
-            raise NotAvailableInState(self.state, cancelable_states)
+            raise NotAvailableInState(self.state, sorted(cancelable_states, key=lambda state: state.value))
         return True
 
     def startProject(self):
@@ -71,4 +71,4 @@ class ExposurePickler:
 
 
     def cleanup_last_data(self) -> None:
-        remove_files(self._logger, [LAST_PROJECT_DATA,])
+        remove_files(self._logger, (LAST_PROJECT_DATA,))
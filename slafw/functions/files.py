@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import shutil
@@ -13,7 +14,7 @@ import subprocess
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from logging import Logger
 
 from slafw import defines, test_runtime
@@ -21,6 +22,9 @@ from slafw.hardware.printer_model import PrinterModel
 from slafw.hardware.hardware import BaseHardware
 
 
+SERIAL_UNSAFE_CHARS = re.compile("[^a-zA-Z0-9]")
+
+
 def get_save_path() -> Optional[Path]:
     """
     Dynamic USB path, first usb device or None
@@ -103,18 +107,21 @@ def usb_remount(path: str):
     subprocess.check_call(["usbremount", path])
 
 
+@functools.lru_cache(maxsize=8)
+def _safe_serial(serial: str) -> str:
+    return SERIAL_UNSAFE_CHARS.sub("_", serial)
+
+
 def get_export_file_name(hw: BaseHardware) -> str:
-    serial = re.sub("[^a-zA-Z0-9]", "_", hw.cpuSerialNo)
+    serial = _safe_serial(hw.cpuSerialNo)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     return f"{serial}.{timestamp}"
 
 
-def remove_files(logger: Logger, files: list) -> None:
+def remove_files(logger: Logger, files: Iterable[Path]) -> None:
     for file in files:
         logger.debug("removing '%s'", file)
         try:
-            file.unlink()
-        except FileNotFoundError:
-            logger.debug("No such file '%s'", file)
+            file.unlink(missing_ok=True)
         except Exception:
             logger.exception("remove_files() exception:")
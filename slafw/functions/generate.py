@@ -37,8 +37,10 @@ def display_usage_heatmap(
     if saved_data.shape != parameters.display_usage_size_px:
         raise DisplayUsageError(f"Wrong saved data shape: {saved_data.shape}")
 
+    # 0-255 range, scaled in place as the loaded array is a private copy anyway
     max_value = saved_data.max()
-    saved_data = saved_data * 255 / max_value # 0-255 range
+    saved_data *= 255
+    saved_data /= max_value
     image = Image.fromarray(saved_data.astype("int8"), "P").transpose(Image.ROTATE_270)
     # two pixels outline
     output = Image.new("P", (parameters.display_usage_size_px[0] + 4, parameters.display_usage_size_px[1] + 4), 255)
@@ -8,6 +8,7 @@ import logging
 import os
 import subprocess
 from math import isclose
+from threading import Lock
 
 import pydbus
 
@@ -51,22 +52,37 @@ def set_update_channel(channel: str):
 
 
 class FactoryMountedRW:
+    """
+    Keep the factory partition mounted rw while inside the context
+
+    Nested and concurrent contexts share a single rw mount: the partition is
+    remounted rw by the outermost enter and back ro by the last exit only.
+    """
+
+    _lock = Lock()
+    _depth = 0
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
     def __enter__(self):
-        self.logger.info("Remounting factory partition rw")
-        if test_runtime.testing:
-            self.logger.warning("Skipping factory RW remount due to testing")
-        else:
-            subprocess.check_call(["/usr/bin/mount", "-o", "remount,rw", str(defines.factoryMountPoint)])
+        with self._lock:
+            if FactoryMountedRW._depth == 0:
+                self._remount("rw")
+            FactoryMountedRW._depth += 1
 
     def __exit__(self, exception_type, exception_value, exception_traceback):
-        self.logger.info("Remounting factory partition ro")
+        with self._lock:
+            FactoryMountedRW._depth -= 1
+            if FactoryMountedRW._depth == 0:
+                self._remount("ro")
+
+    def _remount(self, mode: str):
+        self.logger.info("Remounting factory partition %s", mode)
         if test_runtime.testing:
             self.logger.warning("Skipping factory RW remount due to testing")
         else:
-            subprocess.check_call(["/usr/bin/mount", "-o", "remount,ro", str(defines.factoryMountPoint)])
+            subprocess.check_call(["/usr/bin/mount", "-o", f"remount,{mode}", str(defines.factoryMountPoint)])
 
 
 def set_configured_printer_model(model: PrinterModel):
@@ -33,7 +33,8 @@ def parse_axis(text: str, axis: str) -> int:
 
 
 def format_axis(position_nm: int) -> str:
-    return f"{position_nm // 1000000}.{position_nm % 1000000}"
+    mm, nm = divmod(position_nm, 1000000)
+    return f"{mm}.{nm:06d}"
 
 
 @unique
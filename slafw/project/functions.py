@@ -4,7 +4,6 @@
 # Copyright (C) 2020 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import numpy
 from PIL import Image
 
 from slafw.errors.errors import NotUVCalibrated, NotMechanicallyCalibrated
@@ -13,8 +12,7 @@ from slafw.hardware.uv_led import UvLedParameters
 
 
 def get_white_pixels(image: Image) -> int:
-    np_array = numpy.array(image.histogram())
-    return int(numpy.sum(np_array[128:]))  # simple threshold
+    return sum(image.histogram()[128:])  # simple threshold
 
 
 def check_ready_to_print(config: HwConfig, uv_parameters: UvLedParameters) -> None:
@@ -141,7 +141,11 @@ class DataExport(ABC, Thread):
         except ProcessLookupError:
             pass
 
-        self._task.cancel()
+        # Cancel is requested from a different thread, wake the export loop to process it right away
+        try:
+            self._task.get_loop().call_soon_threadsafe(self._task.cancel)
+        except RuntimeError:
+            self.logger.debug("Data export loop already closed, nothing to cancel")
 
     def run(self):
         self.logger.info("Running data export of type %s", self.type)
@@ -233,15 +237,18 @@ class FileReader(BufferedReader):
     CHUNK_SIZE constant is used for file upload granularity control
     """
 
-    CHUNK_SIZE = 8192
+    CHUNK_SIZE = 65536
 
     def __init__(self, file, callback: Callable[[int, int], None] = None):
         self._total_size = Path(file.name).stat().st_size
-        super().__init__(file, self._total_size)
+        # Reads bypass the buffer, keep it small instead of allocating the whole file size
+        super().__init__(file, self.CHUNK_SIZE)
         self._file = file
         self._callback = callback
 
     def read(self, size=-1):
+        if size < 0:
+            size = self.CHUNK_SIZE
         data = self._file.read(min(self.CHUNK_SIZE, size))
         if self._callback:
             self._callback(self._file.tell(), self._total_size)
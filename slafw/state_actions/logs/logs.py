@@ -3,9 +3,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import asyncio
+import lzma
+import os
 import shutil
+import tarfile
 from asyncio.subprocess import Process
 from pathlib import Path
+from threading import Event
+from typing import Optional
 
 from slafw import defines
 from slafw.errors.errors import DisplayUsageError
@@ -13,20 +18,93 @@ from slafw.functions.generate import display_usage_heatmap
 from slafw.functions.files import get_export_file_name
 from slafw.hardware.hardware import BaseHardware
 from slafw.state_actions.data_export import DataExport, UsbExport, ServerUpload
-from slafw.state_actions.logs.summary import create_summary
+from slafw.state_actions.logs.summary import assemble_summary, write_summary
+
+SUMMARY_TIMEOUT_S = 30
+
+
+def _copy_tree(src: Path, dst: Path):
+    # Hardlink the files if possible, the tree is going to be archived right away
+    try:
+        shutil.copytree(src, dst, copy_function=os.link)
+    except shutil.Error:
+        # Cross-device links are not possible, fall back to the regular copy
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst)
 
 
 def export_configs(temp_dir: Path):
     if defines.wizardHistoryPath.is_dir():
-        shutil.copytree(defines.wizardHistoryPath, temp_dir / defines.wizardHistoryPath.name)
+        _copy_tree(defines.wizardHistoryPath, temp_dir / defines.wizardHistoryPath.name)
     if defines.wizardHistoryPathFactory.is_dir():
-        shutil.copytree(defines.wizardHistoryPathFactory, temp_dir / defines.wizardHistoryPathFactory.name)
+        _copy_tree(defines.wizardHistoryPathFactory, temp_dir / defines.wizardHistoryPathFactory.name)
     if defines.configDir.exists():
-        shutil.copytree(defines.configDir, temp_dir / defines.configDir.name)
+        _copy_tree(defines.configDir, temp_dir / defines.configDir.name)
     if defines.factoryMountPoint.exists():
-        shutil.copytree(defines.factoryMountPoint, temp_dir / defines.factoryMountPoint.name)
+        _copy_tree(defines.factoryMountPoint, temp_dir / defines.factoryMountPoint.name)
         shutil.copyfile(defines.expoPanelLogPath, temp_dir / defines.expoPanelLogFileName)
 
+
+class _CancelableWriter:
+    """
+    Write-only file wrapper aborting the write once the cancel event is set
+
+    The tar stream writes in small records, so a cancelled compression stops almost immediately.
+    """
+
+    def __init__(self, file, cancel: Event):
+        self._file = file
+        self._cancel = cancel
+
+    def write(self, data) -> int:
+        if self._cancel.is_set():
+            raise InterruptedError("Log compression cancelled")
+        return self._file.write(data)
+
+
+def compress_logs(logs_dir: Path, log_tar_file: Path, cancel: Event):
+    # Stream the tar straight into xz (preset 0, same as "xz -0") without spawning tar/xz processes. This is single
+    # threaded unlike "xz -T0", but the threaded xz splits the stream into 1 MiB blocks with preset 0, so the few MB
+    # of logs give it only a handful of blocks to parallelize, which does not pay for the sh, tar and xz execs.
+    with lzma.open(log_tar_file, "wb", preset=0) as xz_file:
+        with tarfile.open(fileobj=_CancelableWriter(xz_file, cancel), mode="w|") as tar:
+            tar.add(logs_dir, arcname=logs_dir.name)
+
+
+async def run_compress_logs(parent: DataExport, logs_dir: Path, log_tar_file: Path):
+    # DataExport.cancel only kills parent.proc, the compression thread has to be stopped here. Wait for the thread
+    # to finish even when cancelled, the temporary directory it reads from is removed as soon as this returns.
+    cancel = Event()
+    compression = asyncio.ensure_future(asyncio.to_thread(compress_logs, logs_dir, log_tar_file, cancel))
+    try:
+        await asyncio.shield(compression)
+    except asyncio.CancelledError:
+        cancel.set()
+        while not compression.done():
+            try:
+                await asyncio.wait({compression})
+            except asyncio.CancelledError:
+                pass
+        if not compression.cancelled():
+            compression.exception()
+        raise
+    except Exception:
+        parent.logger.exception("Log compression failed")
+        log_tar_file.unlink(missing_ok=True)
+
+
+async def run_create_summary(parent: DataExport, summary_file: Path) -> Optional[str]:
+    # Threads cannot be cancelled, on timeout or cancel the worker keeps polling the hardware until it finishes.
+    # It only assembles the data, the summary is written here once the data arrived, so an abandoned worker never
+    # touches the export directory which may be already archived or removed.
+    try:
+        data = await asyncio.wait_for(asyncio.to_thread(assemble_summary, parent.hw), timeout=SUMMARY_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        parent.logger.error("Log export summary timed out after %d s", SUMMARY_TIMEOUT_S)
+        return None
+    return write_summary(data, parent.logger, summary_file)
+
+
 async def run_log_export_process(data_file: Path) -> Process:
     return await asyncio.create_subprocess_shell(
         str(defines.script_dir / f"export_logs.sh '{data_file}'"),
@@ -40,13 +118,26 @@ async def do_export(parent: DataExport, tmpdir_path: Path) -> Path:
     summary_file = logs_dir / "summary.json"
     display_usage_file = logs_dir / "display_usage.png"
 
+    parent.logger.debug("Running log export script")
+    parent.proc = await run_log_export_process(log_file)
+
     parent.logger.info("Creating log export summary")
-    summary = create_summary(parent.hw, parent.logger, summary_path = summary_file)
+    summary, (_, stderr) = await asyncio.gather(
+        run_create_summary(parent, summary_file),
+        parent.proc.communicate(),
+    )
     if summary:
         parent.logger.debug("Log export summary created")
     else:
         parent.logger.error("Log export summary failed to create")
 
+    parent.logger.debug("Log export script finished")
+    if parent.proc.returncode != 0:
+        error = "Log export jounalctl failed to create"
+        if stderr:
+            error += f" - {stderr.decode()}"
+        parent.logger.error(error)
+
     parent.logger.info("Creating display usage heatmap")
     try:
         display_usage_heatmap(
@@ -59,17 +150,6 @@ async def do_export(parent: DataExport, tmpdir_path: Path) -> Path:
     except Exception:
         parent.logger.exception("Create display usage exception")
 
-    parent.logger.debug("Running log export script")
-    parent.proc = await run_log_export_process(log_file)
-
-    parent.logger.debug("Waiting for log export to finish")
-    _, stderr = await parent.proc.communicate()
-    if parent.proc.returncode != 0:
-        error = "Log export jounalctl failed to create"
-        if stderr:
-            error += f" - {stderr.decode()}"
-        parent.logger.error(error)
-
     parent.logger.debug("Waiting for configs export to finish")
     try:
         export_configs(logs_dir)
@@ -77,16 +157,8 @@ async def do_export(parent: DataExport, tmpdir_path: Path) -> Path:
         parent.logger.exception("Config export exception")
 
     log_tar_file = tmpdir_path / f"logs.{get_export_file_name(parent.hw)}.tar.xz"
-    parent.proc = await asyncio.create_subprocess_shell(
-        f"tar -cf - -C '{tmpdir_path}' '{logs_dir.name}' | xz -T0 -0 > '{log_tar_file}'",
-        stderr=asyncio.subprocess.PIPE
-    )
-    _, stderr = await parent.proc.communicate()
-    if parent.proc.returncode != 0:
-        error = "Log compression failed"
-        if stderr:
-            error += f" - {stderr.decode()}"
-        parent.logger.error(error)
+    parent.logger.debug("Compressing exported logs")
+    await run_compress_logs(parent, logs_dir, log_tar_file)
 
     parent.proc = None
 
@@ -31,6 +31,10 @@ from slafw.hardware.hardware import BaseHardware
 
 def create_summary(hw: BaseHardware, logger: logging.Logger, summary_path:
 Path):
+    return write_summary(assemble_summary(hw), logger, summary_path)
+
+
+def assemble_summary(hw: BaseHardware) -> Mapping[str, Any]:
     data_template: Mapping[str, Callable[[], Any]] = {
         "hardware": functools.partial(log_hw, hw),
         "system": log_system,
@@ -54,7 +58,10 @@ Path):
 
     if exceptions:
         data["exceptions"] = exceptions
+    return data
+
 
+def write_summary(data: Mapping[str, Any], logger: logging.Logger, summary_path: Path):
     try:
         with summary_path.open("w") as summary_file:
             summary_file.write(json.dumps(data, indent=2, sort_keys=True))
@@ -34,18 +34,20 @@ class ExposureState(Enum):
 
     @staticmethod
     def finished_states():
-        return [ExposureState.FAILURE, ExposureState.CANCELED, ExposureState.FINISHED, ExposureState.DONE]
+        return FINISHED_STATES
 
     @staticmethod
     def cancelable_states():
-        cancelable_states = ExposureState.finished_states()
-        cancelable_states.extend((
-            ExposureState.CONFIRM,
-            ExposureState.CHECKS,
-            ExposureState.POUR_IN_RESIN,
-            ExposureState.HOMING_AXIS
-        ))
-        return cancelable_states
+        return CANCELABLE_STATES
+
+
+FINISHED_STATES = frozenset((ExposureState.FAILURE, ExposureState.CANCELED, ExposureState.FINISHED, ExposureState.DONE))
+CANCELABLE_STATES = FINISHED_STATES | {
+    ExposureState.CONFIRM,
+    ExposureState.CHECKS,
+    ExposureState.POUR_IN_RESIN,
+    ExposureState.HOMING_AXIS,
+}
 
 
 @unique
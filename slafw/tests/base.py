@@ -65,6 +65,8 @@ class SlafwTestCase(TestCase):
     SAMPLES_DIR = Path(samples.__file__).parent
     DATA_DIR = Path(defines.dataPath)
     EEPROM_FILE = Path.cwd() / "EEPROM.dat"
+    # Keep per-test files in RAM where a tmpfs is available
+    TEMP_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
 
     def setUp(self) -> None:
         # gitlab CI job creates model folder in different location due to restricted permissions in Docker container
@@ -74,8 +76,8 @@ class SlafwTestCase(TestCase):
 
         super().setUp()
 
-        self.temp_dir_obj = tempfile.TemporaryDirectory()  # pylint: disable = consider-using-with
-        self.temp_dir_project = tempfile.TemporaryDirectory()  # pylint: disable = consider-using-with
+        self.temp_dir_obj = tempfile.TemporaryDirectory(dir=self.TEMP_ROOT)  # pylint: disable = consider-using-with
+        self.temp_dir_project = tempfile.TemporaryDirectory(dir=self.TEMP_ROOT)  # pylint: disable = consider-using-with
         self.TEMP_DIR = Path(self.temp_dir_obj.name)
 
         self.__base_patches = self.patches()
@@ -229,7 +231,7 @@ class SlafwTestCaseDBus(SlafwTestCase, DBusTestCase):
         super().setUp()
 
         # DBus mocks
-        nm = NetworkManager()
+        self.network_manager = NetworkManager()
         bus = pydbus.SystemBus()
         self.hostname = Hostname()
         self.locale = Locale()
@@ -238,11 +240,11 @@ class SlafwTestCaseDBus(SlafwTestCase, DBusTestCase):
         self.dbus_mocks = [
             bus.publish(
                 NetworkManager.__INTERFACE__,
-                nm,
-                ("Settings", nm),
-                ("ethernet", nm),
-                ("wifi0", nm),
-                ("wifi1", nm),
+                self.network_manager,
+                ("Settings", self.network_manager),
+                ("ethernet", self.network_manager),
+                ("wifi0", self.network_manager),
+                ("wifi1", self.network_manager),
             ),
             bus.publish(FileManager0.__INTERFACE__, FileManager0()),
             bus.publish(Hostname.__INTERFACE__, self.hostname),
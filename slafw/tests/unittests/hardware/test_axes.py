@@ -6,8 +6,8 @@
 import asyncio
 import unittest
 from abc import ABC
-from time import sleep
-from typing import Tuple
+from time import sleep, monotonic
+from typing import Tuple, Callable, Optional
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, PropertyMock, patch
 
@@ -16,19 +16,41 @@ from slafw.configs.hw import HwConfig
 from slafw.configs.unit import Nm, Ustep, Unit
 from slafw.errors.errors import TiltPositionFailed, TowerPositionFailed, \
     TowerMoveFailed, TiltMoveFailed, TowerHomeFailed, TiltHomeFailed
-from slafw.hardware.axis import Axis, HomingStatus
+from slafw.hardware.axis import Axis, HomingStatus, format_axis, parse_axis
+from slafw.hardware.profiles import SingleProfile
 
 from slafw.hardware.printer_model import PrinterModel
 from slafw.hardware.sl1.tilt import TiltSL1
 from slafw.hardware.sl1.tower import TowerSL1
 from slafw.motion_controller.sl1_controller import MotionControllerSL1
 from slafw.tests.base import SlafwTestCase
+from slafw.tests.mocks import mc_port
 from slafw.exposure.profiles import ExposureProfileSL1
 
 
 # pylint: disable = protected-access
 # pylint: disable = too-many-public-methods
 
+POLL_MIN_S = 0.0002
+POLL_MAX_S = 0.005
+
+
+def _wait_until(condition: Callable[[], bool], timeout_s: float) -> bool:
+    """
+    Poll the condition with delay doubling from POLL_MIN_S up to POLL_MAX_S
+
+    Simulated moves often finish within a few milliseconds, the short initial
+    delays catch them without wasting a fixed 100 ms step.
+    """
+    deadline = monotonic() + timeout_s
+    delay = POLL_MIN_S
+    while not condition():
+        if monotonic() > deadline:
+            return False
+        sleep(delay)
+        delay = min(delay * 2, POLL_MAX_S)
+    return True
+
 
 class DoNotRunTestDirectlyFromBaseClass:
     # pylint: disable = too-few-public-methods
@@ -39,17 +61,49 @@ class DoNotRunTestDirectlyFromBaseClass:
         incompatible_unit: Unit
         fullstep_offset: Tuple[int]  # tower is set to 1/16 ustepping, tilt is set to 1/32
 
+        mcc: MotionControllerSL1
+
+        @classmethod
+        def setUpClass(cls) -> None:
+            super().setUpClass()
+            # Single MC simulator per test class, the axis state is reset after each test. The per test patches from
+            # SlafwTestCase.patches() are started in setUp, too late for the MC created here, so it needs its own.
+            cls._mc_patches = [
+                patch("slafw.motion_controller.sl1_controller.UInput"),
+                patch("slafw.motion_controller.base_controller.serial", mc_port),
+            ]
+            for p in cls._mc_patches:
+                p.start()
+            cls.mcc = MotionControllerSL1()
+            cls.mcc.open()
+
+        @classmethod
+        def tearDownClass(cls) -> None:
+            cls.mcc.exit()
+            for p in cls._mc_patches:
+                p.stop()
+            super().tearDownClass()
+
         def setUp(self) -> None:
             super().setUp()
             self.config = HwConfig()
             self.power_led = Mock()
-            self.mcc = MotionControllerSL1()
-            self.mcc.open()
             self.printer_model = PrinterModel.SL1
 
-        def tearDown(self) -> None:
-            self.mcc.exit()
-            super().tearDown()
+        def _reset_axis(self) -> None:
+            """Put the shared MC simulator back to the state the next test starts from, registered once axis exists"""
+            self.axis.stop()
+            # Tests modify and write the profiles, write the default ones back to the MC
+            self.axis.profiles.factory_reset(to_defaults=True)
+            self.axis.apply_all_profiles()
+            self._reset_to(self.unit(0))
+            self.axis.release()
+
+        def _reset_to(self, position: Unit, profile: Optional[SingleProfile] = None) -> None:
+            """Put the stopped axis to the state a test scenario starts from"""
+            if profile is not None:
+                self.axis.actual_profile = profile
+            self.axis.position = position
 
         def test_position(self):
             positions = [self.pos, self.pos // 2]
@@ -64,9 +118,14 @@ class DoNotRunTestDirectlyFromBaseClass:
             self.assertFalse(self.axis.moving)
             self.axis.move(self.pos)
             self.assertTrue(self.axis.moving)
-            while self.axis.moving:
-                self.assertFalse(self.axis.on_target_position)
-                sleep(0.1)
+
+            def stopped() -> bool:
+                if self.axis.moving:
+                    self.assertFalse(self.axis.on_target_position)
+                    return False
+                return True
+
+            self.assertTrue(_wait_until(stopped, timeout_s=60))
             self.assertFalse(self.axis.moving)
             self.assertTrue(self.axis.on_target_position)
             self.assertEqual(self.axis.position, self.pos)
@@ -79,14 +138,14 @@ class DoNotRunTestDirectlyFromBaseClass:
             side_effect_position = [one, one, one, two, two, two, pos, pos]
 
             # normal behaviour
-            self.axis.position = self.axis.home_position
+            self._reset_to(self.axis.home_position)
             self.axis.move(pos)
             asyncio.run(self.axis.ensure_position_async())
             self.assertFalse(self.axis.moving)
             self.assertEqual(self.axis.position, pos)
 
             # successful retries 2
-            self.axis.position = self.axis.home_position
+            self._reset_to(self.axis.home_position)
             with patch(path, new_callable=PropertyMock) as mock_position:
                 mock_position.side_effect = side_effect_position
                 self.axis.move(pos)
@@ -95,7 +154,7 @@ class DoNotRunTestDirectlyFromBaseClass:
             self.assertEqual(self.axis.position, pos)
 
             # maximum tries reached
-            self.axis.position = self.axis.home_position
+            self._reset_to(self.axis.home_position)
             with patch(path, new_callable=PropertyMock) as mock_position:
                 mock_position.side_effect = side_effect_position
                 self.axis.move(pos)
@@ -104,7 +163,7 @@ class DoNotRunTestDirectlyFromBaseClass:
                 self.assertFalse(self.axis.moving)
 
         def test_move_ensure(self):
-            self.axis.position = self.axis.home_position
+            self._reset_to(self.axis.home_position)
             self.axis.move_ensure(self.pos)
             self.assertFalse(self.axis.moving)
             self.assertEqual(self.axis.position, self.pos)
@@ -121,9 +180,8 @@ class DoNotRunTestDirectlyFromBaseClass:
 
         def _test_move_api_up_down(self, speed: int):
             # set some profile which is not used for moving axis
-            self.axis.actual_profile = self.axis.profiles[10]
+            self._reset_to(self.pos, self.axis.profiles[10])
             actual_profile = self.axis.actual_profile
-            self.axis.position = self.pos
             self.axis.move_api(speed)
             self.assertTrue(self.axis.moving)
             self.assertLess(self.pos, self.axis.position)
@@ -145,20 +203,19 @@ class DoNotRunTestDirectlyFromBaseClass:
 
         # TODO: fix mc-fw to mimic real HW accurately. Now moves tilt: +31 -32 steps, tower +-16 steps
         def test_move_api_goto_fullstep(self):
-            for i in range(2):
-                self.axis.position = self.pos
-                # move down fast (-2)
-                # move up fast (2)
-                self.axis.move_api(((i - 1) * 4) + 2)
-                self.assertTrue(self.axis.moving)
-                self.axis.stop()
-                pos = self.axis.position
-                self.axis.move_api(0, fullstep=True)
-                self.assertEqual(pos + self.fullstep_offset[i],
-                                 self.axis.position)
+            # move down fast (-2), move up fast (2)
+            for speed, offset in zip((-2, 2), self.fullstep_offset):
+                with self.subTest(speed=speed):
+                    self.axis.position = self.pos
+                    self.axis.move_api(speed)
+                    self.assertTrue(self.axis.moving)
+                    self.axis.stop()
+                    pos = self.axis.position
+                    self.axis.move_api(0, fullstep=True)
+                    self.assertEqual(pos + offset, self.axis.position)
 
         def stop(self) -> None:
-            self.axis.position = self.axis.home_position
+            self._reset_to(self.axis.home_position)
             self.axis.move(self.pos)
             while self.axis.moving:
                 self.axis.stop()
@@ -167,24 +224,21 @@ class DoNotRunTestDirectlyFromBaseClass:
 
         def test_release(self):
             self.axis.sync_ensure()
-            self.axis.position = self.axis.home_position
+            self._reset_to(self.axis.home_position)
             self.axis.move_api(2)
             self.axis.release()
             self.assertFalse(self.axis.synced)
 
         # TODO: fix mc-fw to mimic real HW accurately. Now moves tilt: +31 -32 steps, tower +-16 steps
         def test_go_to_fullstep(self):
-            for i in range(2):
-                self.axis.position = self.pos
-                self.axis.go_to_fullstep(go_up=bool(i))
-                self.assertEqual(self.axis.position,
-                                 self.pos + self.fullstep_offset[i])
+            for go_up, offset in zip((False, True), self.fullstep_offset):
+                with self.subTest(go_up=go_up):
+                    self.axis.position = self.pos
+                    self.axis.go_to_fullstep(go_up=go_up)
+                    self.assertEqual(self.axis.position, self.pos + offset)
 
         def _assert_homing_status_reached(self, status: HomingStatus, timeout_s = 60):
-            for _ in range(timeout_s * 10):
-                if self.axis.homing_status == status:
-                    break
-                sleep(0.1)
+            _wait_until(lambda: self.axis.homing_status == status, timeout_s)
             self.assertEqual(status, self.axis.homing_status)
 
         def test_sync(self):
@@ -242,9 +296,10 @@ class DoNotRunTestDirectlyFromBaseClass:
             # already home axis does not home. Just move to top position
 
         def test_actual_profile(self):
-            for profile in self.axis.profiles:
-                self.axis.actual_profile = profile
-                self.assertEqual(profile, self.axis.actual_profile)
+            axis = self.axis
+            for profile in axis.profiles:
+                axis.actual_profile = profile
+                self.assertEqual(profile, axis.actual_profile)
 
         def test_unit(self):
             self.assertEqual(type(self.axis.position), self.unit)
@@ -258,9 +313,17 @@ class DoNotRunTestDirectlyFromBaseClass:
                 self.axis.move(self.incompatible_unit(0))
 
         def test_set_sensitivity(self):
-            self.axis.set_stepper_sensitivity(-2)
-            p = self.axis.profiles.homingFast
-            p.get_values()["starting_steprate"].set_factory_value(p, 10)
+            homing_fast = self.axis.profiles.homingFast
+            homing_slow = self.axis.profiles.homingSlow
+            fast_values = self.axis.sensitivity_dict["homingFast"]
+            slow_values = self.axis.sensitivity_dict["homingSlow"]
+            for sensitivity in range(-2, 3):
+                self.axis.set_stepper_sensitivity(sensitivity)
+                fast = fast_values[sensitivity + 2]
+                slow = slow_values[sensitivity + 2]
+                self.assertEqual((fast[0], fast[1]), (homing_fast.current, homing_fast.stallguard_threshold))
+                self.assertEqual((slow[0], slow[1]), (homing_slow.current, homing_slow.stallguard_threshold))
+            homing_fast.get_values()["starting_steprate"].set_factory_value(homing_fast, 10)
             with self.assertRaises(RuntimeError):
                 self.axis.set_stepper_sensitivity(0)
 
@@ -277,6 +340,7 @@ class TestTilt(DoNotRunTestDirectlyFromBaseClass.BaseSL1AxisTest):
         self.incompatible_unit = Nm
         self.fullstep_offset = (Ustep(-32), Ustep(31))
         self.axis.start()
+        self.addCleanup(self._reset_axis)
 
     def test_name(self) -> str:
         self.assertEqual(self.axis.name, "tilt")
@@ -340,6 +404,7 @@ class TestTower(DoNotRunTestDirectlyFromBaseClass.BaseSL1AxisTest):
         offset = self.config.tower_microsteps_to_nm(16)
         self.fullstep_offset = (-offset, offset)
         self.axis.start()
+        self.addCleanup(self._reset_axis)
 
     def test_name(self):
         self.assertEqual(self.axis.name, "tower")
@@ -380,5 +445,16 @@ class TestTower(DoNotRunTestDirectlyFromBaseClass.BaseSL1AxisTest):
     def test_sensitivity(self):
         self.assertEqual(self.axis.sensitivity, self.config.tiltSensitivity)
 
+
+class TestAxisText(unittest.TestCase):
+    def test_format_axis(self):
+        self.assertEqual("1.000001", format_axis(1_000_001))
+        self.assertEqual("12.500000", format_axis(12_500_000))
+
+    def test_format_parse_roundtrip(self):
+        for position_nm in (0, 1, 999_999, 1_000_001, 150_123_456):
+            self.assertEqual(position_nm, parse_axis(f"Z:{format_axis(position_nm)}", "Z"))
+
+
 if __name__ == "__main__":
     unittest.main()
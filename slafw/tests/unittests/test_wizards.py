@@ -6,13 +6,12 @@ import asyncio
 import json
 import unittest
 from pathlib import Path
-from shutil import copyfile
-from tempfile import NamedTemporaryFile
-from typing import Optional
+from shutil import copyfile, copytree
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from typing import Any, Callable, Dict, Optional
 from unittest.mock import Mock, AsyncMock, MagicMock, patch
 from dataclasses import dataclass
 import time
-import pydbus
 import toml
 
 from slafw.configs.unit import Nm, Ustep
@@ -33,7 +32,6 @@ from slafw.wizard.checks.base import Check, WizardCheckType, WizardCheckState
 from slafw.wizard.group import CheckGroup
 from slafw.wizard.setup import Configuration, PlatformSetup, TankSetup
 from slafw.wizard.wizard import Wizard
-from slafw.wizard.wizard import serializer
 from slafw.wizard.data_package import WizardDataPackage, make_config_writers
 from slafw.wizard.wizards.calibration import CalibrationWizard
 from slafw.wizard.wizards.displaytest import DisplayTestWizard
@@ -44,6 +42,13 @@ from slafw.wizard.wizards.unboxing import CompleteUnboxingWizard, KitUnboxingWiz
 from slafw.wizard.wizards.uv_calibration import UVCalibrationWizard
 from slafw.wizard.wizards.tank_surface_cleaner import TankSurfaceCleaner
 
+EXPECTED_UV_SENSOR_DATA = [140.7] * 15
+WIZARD_JOIN_TIMEOUT_S = 5  # The wizard is already in a finished state, only the thread teardown remains
+
+
+async def yield_instead_of_sleep(_delay: float):
+    await asyncio.sleep(0)
+
 
 @dataclass
 class MockDataclass:
@@ -63,6 +68,16 @@ class TestGroup(CheckGroup):
 class TestWizardInfrastructure(SlafwTestCaseDBus):
     # pylint: disable=no-self-use
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.loop.close()
+        super().tearDownClass()
+
     def setUp(self) -> None:
         super().setUp()
         self.package = WizardDataPackage(Mock(), MockDataclass(), Mock())
@@ -89,14 +104,14 @@ class TestWizardInfrastructure(SlafwTestCaseDBus):
 
             def __init__(self):
                 MagicMock.__init__(self)
-                Check.__init__(self, WizardCheckType.UNKNOWN, Mock(), [])
+                Check.__init__(self, WizardCheckType.UNKNOWN)
 
         check = Test()
         exception = Exception("Synthetic fail")
         task_body = AsyncMock()
         task_body.side_effect = exception
         check.async_task_run = task_body
-        wizard = Wizard(WizardId.SELF_TEST, [TestGroup(Mock(), [check])], self.package)
+        wizard = Wizard(WizardId.SELF_TEST, [TestGroup(checks=[check])], self.package)
         wizard.start()
         wizard.join()
 
@@ -111,10 +126,10 @@ class TestWizardInfrastructure(SlafwTestCaseDBus):
                 self.add_warning(warning)
 
             def __init__(self):
-                super().__init__(WizardCheckType.UNKNOWN, Mock(), [])
+                super().__init__(WizardCheckType.UNKNOWN)
 
         check = Test()
-        wizard = Wizard(WizardId.SELF_TEST, [TestGroup(Mock(), [check])], self.package)
+        wizard = Wizard(WizardId.SELF_TEST, [TestGroup(checks=[check])], self.package)
         wizard.start()
         wizard.join()
 
@@ -122,16 +137,16 @@ class TestWizardInfrastructure(SlafwTestCaseDBus):
         self.assertIn(warning, wizard.warnings)
 
     def test_group_setup(self):
-        test = TestGroup(Mock(), [])
+        test = TestGroup()
         actions = Mock()
-        asyncio.run(test.run(actions))
+        self.loop.run_until_complete(test.run(actions))
         test.setup_mock.assert_called()
 
     def test_check_execution(self):
         check = AsyncMock()
         actions = Mock()
         group = TestGroup(Mock(), [check])
-        asyncio.run(group.run(actions))
+        self.loop.run_until_complete(group.run(actions))
 
         check.run.assert_called()
 
@@ -147,12 +162,12 @@ class TestWizardInfrastructure(SlafwTestCaseDBus):
             async def async_task_run(self, actions: UserActionBroker):
                 self.progress = 0.5
 
-        check = TestCheck(WizardCheckType.UNKNOWN, Mock(), [])
+        check = TestCheck(WizardCheckType.UNKNOWN)
         callback = Mock()
         callback.__name__ = "callback"
         check.data_changed.connect(lambda: callback(check.data["progress"]))
 
-        asyncio.run(check.run(Mock(), Mock(), Mock()))
+        self.loop.run_until_complete(check.run(Mock(), Mock(), Mock()))
 
         callback.assert_any_call(0)
         callback.assert_any_call(0.5)
@@ -174,20 +189,32 @@ class TestWizardsBase(SlafwTestCaseDBus):
                 exposure_image=Mock()
         )
 
+    @staticmethod
+    def _wire_states(wizard: Wizard, handlers: Dict[WizardState, Callable[[], Any]]):
+        """Call the handler registered for each state the wizard enters"""
+
+        def on_state_changed(state):
+            handler = handlers.get(state)
+            if handler:
+                handler()
+
+        wizard.state_changed.connect(on_state_changed)
+
     def _run_wizard(self, wizard: Wizard, limit_s: int = 5, expected_state=WizardState.DONE):
         wizard.start()
-        wizard.join(limit_s)
 
-        while wizard.is_alive() and wizard.state not in WizardState.finished_states():
-            if wizard.state == WizardState.STOPPED:
-                wizard.abort()
-            else:
-                try:
-                    wizard.force_cancel()
-                except RuntimeError:
-                    pass  # Wizard might have reached stopped in the meantime
-
-        wizard.join(limit_s * 3)
+        if not wizard.finished.wait(limit_s):
+            while wizard.is_alive() and not wizard.finished.is_set():
+                if wizard.state == WizardState.STOPPED:
+                    wizard.abort()
+                else:
+                    try:
+                        wizard.force_cancel()
+                    except RuntimeError:
+                        pass  # Wizard might have reached stopped in the meantime
+                wizard.finished.wait(0.1)
+
+        wizard.join(WIZARD_JOIN_TIMEOUT_S)
         self.assertFalse(wizard.is_alive())
         self.assertEqual(expected_state, wizard.state)
 
@@ -196,31 +223,22 @@ class TestDisplayTest(TestWizardsBase):
     def test_display_test(self):
         wizard = DisplayTestWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.PREPARE_DISPLAY_TEST:
-                wizard.prepare_displaytest_done()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-            if state == WizardState.TEST_DISPLAY:
-                wizard.report_display(True)
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.PREPARE_DISPLAY_TEST: wizard.prepare_displaytest_done,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+            WizardState.TEST_DISPLAY: lambda: wizard.report_display(True),
+        })
         self._run_wizard(wizard)
 
     def test_display_test_fail(self):
         wizard = DisplayTestWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.PREPARE_DISPLAY_TEST:
-                wizard.prepare_displaytest_done()
-            if state == WizardState.TEST_DISPLAY:
-                wizard.report_display(False)
-            if state == WizardState.STOPPED:
-                wizard.abort()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.PREPARE_DISPLAY_TEST: wizard.prepare_displaytest_done,
+            WizardState.TEST_DISPLAY: lambda: wizard.report_display(False),
+            WizardState.STOPPED: wizard.abort,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+        })
         self._run_wizard(wizard, expected_state=WizardState.FAILED)
         self.assertEqual("#10120", wizard.data["displaytest_exception"]["code"])
 
@@ -242,13 +260,10 @@ class TestUpgradeWizard(TestWizardsBase):
     def test_sl1s_upgrade_confirm(self):
         wizard = SL1SUpgradeWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.SL1S_CONFIRM_UPGRADE:
-                wizard.sl1s_confirm_upgrade()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.SL1S_CONFIRM_UPGRADE: wizard.sl1s_confirm_upgrade,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+        })
         self._run_wizard(wizard)
         self.assertEqual(1, self.hw.config.vatRevision)
         self.assertEqual(PrinterModel.SL1S, get_configured_printer_model())
@@ -263,56 +278,55 @@ class TestUpgradeWizard(TestWizardsBase):
     def test_sl1s_upgrade_reject(self):
         wizard = SL1SUpgradeWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.SL1S_CONFIRM_UPGRADE:
-                print("Rejecting upgrade")
-                wizard.sl1s_reject_upgrade()
-            if state == WizardState.CANCELED:
-                print("aborting")
-                wizard.abort()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.SL1S_CONFIRM_UPGRADE: wizard.sl1s_reject_upgrade,
+            WizardState.CANCELED: wizard.abort,
+        })
         self._run_wizard(wizard, expected_state=WizardState.CANCELED)
         self.assertEqual(0, self.hw.config.vatRevision)
         self.assertEqual(PrinterModel.SL1, get_configured_printer_model())
 
 
 class TestWizards(TestWizardsBase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Files touched by the wizards are prepared just once and copied to TEMP_DIR for every test
+        cls.fixture_dir_obj = TemporaryDirectory(dir=cls.TEMP_ROOT)  # pylint: disable = consider-using-with
+        fixture_dir = Path(cls.fixture_dir_obj.name)
+
+        # Mock factory data
+        copyfile(cls.SAMPLES_DIR / "uv_calibration_data.json", fixture_dir / UVCalibrationWizard.get_data_filename())
+        copyfile(cls.SAMPLES_DIR / "self_test_data.json", fixture_dir / SelfTestWizard.get_data_filename())
+        copyfile(cls.SAMPLES_DIR / defines.expoPanelLogFileName, fixture_dir / defines.expoPanelLogFileName)
+
+        # Setup files that are touched by packing wizard
+        for name in ("api.key", "localtime", "slicer_profiles", "factory", "serial", "ssh"):
+            (fixture_dir / name).touch()
+        (fixture_dir / "projects").mkdir()
+        (fixture_dir / "projects" / "dummy_project.sl1").touch()
+        (fixture_dir / "remote_config").write_text("DUMMY TEXT")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.fixture_dir_obj.cleanup()
+        super().tearDownClass()
+
     def setUp(self) -> None:
         super().setUp()
         set_configured_printer_model(PrinterModel.SL1)
 
-        # Mock factory data
         self.hw.config.uvPwm = 210
-        copyfile(
-            self.SAMPLES_DIR / "uv_calibration_data.json",
-            defines.factoryMountPoint / UVCalibrationWizard.get_data_filename(),
-        )
-        copyfile(
-            self.SAMPLES_DIR / "self_test_data.json", defines.factoryMountPoint / SelfTestWizard.get_data_filename()
-        )
-
+        copytree(self.fixture_dir_obj.name, self.TEMP_DIR, dirs_exist_ok=True)
         defines.expoPanelLogPath = self.TEMP_DIR / defines.expoPanelLogFileName
-        copyfile(self.SAMPLES_DIR / defines.expoPanelLogFileName, defines.expoPanelLogPath)
-
-        # Setup files that are touched by packing wizard
         defines.http_digest_password_file = self.TEMP_DIR / "api.key"
-        defines.http_digest_password_file.touch()
         defines.local_time_path = self.TEMP_DIR / "localtime"
-        defines.local_time_path.touch()
         defines.slicerProfilesFile = self.TEMP_DIR / "slicer_profiles"
-        defines.slicerProfilesFile.touch()
         defines.internalProjectPath = self.TEMP_DIR / "projects"
-        defines.internalProjectPath.mkdir()
-        (defines.internalProjectPath / "dummy_project.sl1").touch()
         defines.remoteConfig = self.TEMP_DIR / "remote_config"
-        defines.remoteConfig.write_text("DUMMY TEXT")
         defines.factory_enable = self.TEMP_DIR / "factory"
-        defines.factory_enable.touch()
         defines.serial_service_enabled = self.TEMP_DIR / "serial"
-        defines.serial_service_enabled.touch()
         defines.ssh_service_enabled = self.TEMP_DIR / "ssh"
-        defines.ssh_service_enabled.touch()
 
         # Mock changed settings
         self.time_date.SetNTP(not self.time_date.DEFAULT_NTP, False)
@@ -321,14 +335,7 @@ class TestWizards(TestWizardsBase):
         self.touch_ui_config = Path(NamedTemporaryFile(delete=False).name)  # pylint: disable = consider-using-with
         self.backlight_state = Path(NamedTemporaryFile(delete=False).name)  # pylint: disable = consider-using-with
 
-    def tearDown(self) -> None:
-        del self.hw
-        self.touch_ui_config.unlink(missing_ok=True)
-        self.backlight_state.unlink(missing_ok=True)
-        super().tearDown()
-
-    def _run_wizard(self, wizard: Wizard, limit_s: int = 5, expected_state=WizardState.DONE):
-        with (
+        for patcher in (
             patch("slafw.wizard.checks.factory_reset.copyfile"),
             patch("slafw.wizard.checks.factory_reset.ch_mode_owner"),
             patch("slafw.wizard.checks.factory_reset.ResetTouchUI.BACKLIGHT_STATE", self.backlight_state),
@@ -337,9 +344,18 @@ class TestWizards(TestWizardsBase):
                 self.backlight_state.touch
             ),
             patch("slafw.wizard.checks.factory_reset.ResetTouchUI.TOUCH_UI_CONFIG", self.touch_ui_config),
-            patch("slafw.wizard.checks.factory_reset.set_update_channel")
+            patch("slafw.wizard.checks.factory_reset.set_update_channel"),
+            # UV fans check counts warm-up seconds by sleeping, the mocked fans need no time to settle
+            patch("slafw.wizard.checks.uvfans.sleep", yield_instead_of_sleep),
         ):
-            super()._run_wizard(wizard, limit_s, expected_state)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        del self.hw
+        self.touch_ui_config.unlink(missing_ok=True)
+        self.backlight_state.unlink(missing_ok=True)
+        super().tearDown()
 
     def _run_self_test(self, expected_state=WizardState.DONE) -> dict:
         self.hw.config.uvWarmUpTime = 2
@@ -354,29 +370,19 @@ class TestWizards(TestWizardsBase):
         self.hw.tower.move = MagicMock(side_effect=side_effect_move)
         wizard = SelfTestWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.PREPARE_WIZARD_PART_1:
-                wizard.prepare_wizard_part_1_done()
-            if state == WizardState.TEST_AUDIO:
-                wizard.report_audio(True)
-            if state == WizardState.TEST_DISPLAY:
-                wizard.report_display(True)
-            if state == WizardState.PREPARE_WIZARD_PART_2:
-                wizard.prepare_wizard_part_2_done()
-            if state == WizardState.PREPARE_WIZARD_PART_3:
-                wizard.prepare_wizard_part_3_done()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.PREPARE_WIZARD_PART_1: wizard.prepare_wizard_part_1_done,
+            WizardState.TEST_AUDIO: lambda: wizard.report_audio(True),
+            WizardState.TEST_DISPLAY: lambda: wizard.report_display(True),
+            WizardState.PREPARE_WIZARD_PART_2: wizard.prepare_wizard_part_2_done,
+            WizardState.PREPARE_WIZARD_PART_3: wizard.prepare_wizard_part_3_done,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+        })
         self._run_wizard(wizard, expected_state=expected_state, limit_s=100000)
 
         wizard_data_path = defines.configDir / wizard.get_data_filename()
         self.assertTrue(wizard_data_path.exists(), "Wizard data file exists")
-        print(f"Wizard data:\n{wizard_data_path.read_text()}")
-        with wizard_data_path.open("rt") as file:
-            data = serializer.load(file)
-            return data
+        return wizard.data
 
     @patch("slafw.defines.fanWizardStabilizeTime", 0)
     @patch("slafw.defines.fanStartStopTime", 0)
@@ -403,27 +409,25 @@ class TestWizards(TestWizardsBase):
         self.assertEqual(40, data["wizardTempA64"])
         self.assertEqual(12.8, data["wizardResinTriggeredMM"])
         self.assertEqual(0, data["towerSensitivity"])
-        self._assert_final_state("showWizard", expected_value=False)
+        self._assert_final_state(showWizard=False)
 
     def test_self_test_fail(self):
         self.hw.config.uvWarmUpTime = 1
         wizard = SelfTestWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.PREPARE_WIZARD_PART_1:
-                wizard.cancel()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {WizardState.PREPARE_WIZARD_PART_1: wizard.cancel})
         self._run_wizard(wizard, limit_s=1, expected_state=WizardState.CANCELED)
-        self._assert_final_state("showWizard", expected_value=None)
+        self._assert_final_state(showWizard=None)
 
-    def _assert_final_state(self, item: str, expected_value: Optional[bool]):
+    def _assert_final_state(self, **expected_values: Optional[bool]):
+        """Check stored config items, None expects the item at its default"""
         conf = HwConfig(self.hw_config_file)
         conf.read_file()
-        if expected_value is None:
-            self.assertTrue(conf.get_values().get(item).is_default(conf))
-        else:
-            self.assertEqual(expected_value, getattr(conf, item))
+        for item, expected_value in expected_values.items():
+            if expected_value is None:
+                self.assertTrue(conf.get_values().get(item).is_default(conf))
+            else:
+                self.assertEqual(expected_value, getattr(conf, item))
 
     @patch("slafw.defines.fanWizardStabilizeTime", 0)
     @patch("slafw.defines.fanStartStopTime", 0)
@@ -480,31 +484,22 @@ class TestWizards(TestWizardsBase):
     def test_unboxing_complete(self):
         wizard = CompleteUnboxingWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.REMOVE_SAFETY_STICKER:
-                wizard.safety_sticker_removed()
-            if state == WizardState.REMOVE_SIDE_FOAM:
-                wizard.side_foam_removed()
-            if state == WizardState.REMOVE_TANK_FOAM:
-                wizard.tank_foam_removed()
-            if state == WizardState.REMOVE_DISPLAY_FOIL:
-                wizard.display_foil_removed()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.REMOVE_SAFETY_STICKER: wizard.safety_sticker_removed,
+            WizardState.REMOVE_SIDE_FOAM: wizard.side_foam_removed,
+            WizardState.REMOVE_TANK_FOAM: wizard.tank_foam_removed,
+            WizardState.REMOVE_DISPLAY_FOIL: wizard.display_foil_removed,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+        })
         self._run_wizard(wizard)
 
     def test_unboxing_kit(self):
         wizard = KitUnboxingWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.REMOVE_DISPLAY_FOIL:
-                wizard.display_foil_removed()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.REMOVE_DISPLAY_FOIL: wizard.display_foil_removed,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+        })
         self._run_wizard(wizard)
 
     def test_packing_complete(self):
@@ -514,11 +509,7 @@ class TestWizards(TestWizardsBase):
         self.package.runtime_config.factory_mode = True
         wizard = PackingWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.INSERT_FOAM:
-                wizard.foam_inserted()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {WizardState.INSERT_FOAM: wizard.foam_inserted})
         self._run_wizard(wizard)
         self._check_factory_reset(self.hw, unboxing=True, factory_mode=True)
 
@@ -575,7 +566,7 @@ class TestWizards(TestWizardsBase):
 
         self.assertEqual(
             factory_mode,
-            bool(list(defines.internalProjectPath.glob("*"))),
+            any(defines.internalProjectPath.iterdir()),
             "Internal projects removed",
         )
 
@@ -586,7 +577,7 @@ class TestWizards(TestWizardsBase):
         self.assertFalse(defines.serial_service_enabled.exists(), "serial is disabled check")
         self.assertFalse(defines.ssh_service_enabled.exists(), "ssh is disabled check")
         self.assertEqual(
-            pydbus.SystemBus().get("org.freedesktop.NetworkManager").ListConnections(),
+            self.network_manager.ListConnections(),
             [],
         )  # all connections deleted
 
@@ -596,7 +587,6 @@ class TestWizards(TestWizardsBase):
         self.assertEqual(self.hostname.StaticHostname, self.hostname.Hostname)
         self.assertEqual(self.hostname.Hostname, defines.default_hostname + hw.printer_model.name.lower())
         self.assertTrue(self.time_date.is_default_ntp(), "NTP reset to default")
-        print(self.locale.Locale)
         self.assertTrue(self.locale.is_default(), "Locale set to default")
         self.assertFalse(self.touch_ui_config.exists(), "Touch UI config removed")
         self.assertFalse(self.backlight_state.exists(), "Backlight state cleared")
@@ -617,35 +607,27 @@ class TestWizards(TestWizardsBase):
         self.hw.tower.move = MagicMock(side_effect=side_effect_move)
         wizard = CalibrationWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.PREPARE_CALIBRATION_INSERT_PLATFORM_TANK:
-                wizard.prepare_calibration_platform_tank_done()
-            if state == WizardState.PREPARE_CALIBRATION_TILT_ALIGN:
-                wizard.prepare_calibration_tilt_align_done()
-            if state == WizardState.LEVEL_TILT:
-                self.hw.tilt.position = Ustep(4992)
-                wizard.tilt_aligned()
-            if state == WizardState.PREPARE_CALIBRATION_PLATFORM_ALIGN:
-                wizard.prepare_calibration_platform_align_done()
-            if state == WizardState.PREPARE_CALIBRATION_FINISH:
-                wizard.prepare_calibration_finish_done()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        def level_tilt():
+            self.hw.tilt.position = Ustep(4992)
+            wizard.tilt_aligned()
+
+        self._wire_states(wizard, {
+            WizardState.PREPARE_CALIBRATION_INSERT_PLATFORM_TANK: wizard.prepare_calibration_platform_tank_done,
+            WizardState.PREPARE_CALIBRATION_TILT_ALIGN: wizard.prepare_calibration_tilt_align_done,
+            WizardState.LEVEL_TILT: level_tilt,
+            WizardState.PREPARE_CALIBRATION_PLATFORM_ALIGN: wizard.prepare_calibration_platform_align_done,
+            WizardState.PREPARE_CALIBRATION_FINISH: wizard.prepare_calibration_finish_done,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+        })
         self._run_wizard(wizard)
-        self._assert_final_state(item="calibrated", expected_value=True)
+        self._assert_final_state(calibrated=True)
 
     def test_calibration_fail(self):
         wizard = CalibrationWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.PREPARE_CALIBRATION_INSERT_PLATFORM_TANK:
-                wizard.cancel()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {WizardState.PREPARE_CALIBRATION_INSERT_PLATFORM_TANK: wizard.cancel})
         self._run_wizard(wizard, limit_s=1, expected_state=WizardState.CANCELED)
-        self._assert_final_state(item="calibrated", expected_value=False)
+        self._assert_final_state(calibrated=False)
 
     def test_new_expo_panel(self):
         copyfile(self.SAMPLES_DIR / defines.expoPanelLogFileName, defines.expoPanelLogPath)
@@ -654,11 +636,7 @@ class TestWizards(TestWizardsBase):
         display_usage = self.hw.exposure_screen.usage_s
         wizard = NewExpoPanelWizard(self.package)
 
-        def on_state_changed(state):
-            if state == WizardState.PREPARE_NEW_EXPO_PANEL:
-                wizard.new_expo_panel_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {WizardState.PREPARE_NEW_EXPO_PANEL: wizard.new_expo_panel_done})
         self._run_wizard(wizard, limit_s=15, expected_state=WizardState.DONE)
 
         self.assertEqual(self.hw.uv_led.usage_s, uv_usage)
@@ -669,8 +647,7 @@ class TestWizards(TestWizardsBase):
         self.assertEqual(log[last_key]["panel_sn"], self.hw.exposure_screen.serial_number)
         next_to_last_key = list(log)[-2]
         self.assertEqual(log[next_to_last_key]["counter_s"], display_usage)
-        self._assert_final_state(item="showWizard", expected_value=True)
-        self._assert_final_state(item="calibrated", expected_value=False)
+        self._assert_final_state(showWizard=True, calibrated=False)
 
 
 class TestUVCalibration(TestWizardsBase):
@@ -679,6 +656,9 @@ class TestUVCalibration(TestWizardsBase):
         defines.counterLog = self.TEMP_DIR / "counter.log"
         set_configured_printer_model(PrinterModel.SL1)
         self.uv_meter = UVMeterMock(self.hw)
+        patcher = patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def tearDown(self) -> None:
         del self.hw
@@ -686,9 +666,8 @@ class TestUVCalibration(TestWizardsBase):
         super().tearDown()
 
     def test_uv_calibration_no_boost(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            wizard = UVCalibrationWizard(self.package, False, False)
-            self._run_uv_calibration(wizard)
+        wizard = UVCalibrationWizard(self.package, False, False)
+        self._run_uv_calibration(wizard)
 
         # Check wizard data
         self.assertFalse(wizard.data["boost"])
@@ -698,7 +677,7 @@ class TestUVCalibration(TestWizardsBase):
         self.assertEqual(6912, wizard.data["uvLedCounter_s"])
         self.assertEqual(3600, wizard.data["displayCounter_s"])
         self.assertEqual(0, wizard.data["uvSensorType"])
-        self.assertListEqual([140.7 for _ in range(15)], wizard.data["uvSensorData"])
+        self.assertEqual(EXPECTED_UV_SENSOR_DATA, wizard.data["uvSensorData"])
         self.assertEqual(140.7, wizard.data["uvMean"])
         self.assertEqual(0.0, wizard.data["uvStdDev"])
         self.assertEqual(140.7, wizard.data["uvMinValue"])
@@ -707,94 +686,80 @@ class TestUVCalibration(TestWizardsBase):
         self._assert_final_uv_pwm(self.hw.uv_led.parameters.min_pwm)
 
     def test_uv_calibration_boost(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            wizard = UVCalibrationWizard(self.package, False, False)
-            self.uv_meter.multiplier = 0.79
-            self._run_uv_calibration(wizard)
-            self.assertTrue(wizard.data["boost"])  # Boosted as led+display too weak
-            self.assertFalse(defines.counterLog.exists())  # Counter log not written as nothing was reset
+        wizard = UVCalibrationWizard(self.package, False, False)
+        self.uv_meter.multiplier = 0.79
+        self._run_uv_calibration(wizard)
+        self.assertTrue(wizard.data["boost"])  # Boosted as led+display too weak
+        self.assertFalse(defines.counterLog.exists())  # Counter log not written as nothing was reset
         self._assert_final_uv_pwm(self.hw.uv_led.parameters.min_pwm)
 
     def test_uv_calibration_boost_difference(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            self.hw.config.data_factory_values["uvPwm"] = 100
-            wizard = UVCalibrationWizard(self.package, False, False)
-            self.uv_meter.multiplier = 0.85
-            self._run_uv_calibration(wizard)
-            self.assertTrue(wizard.data["boost"])  # Boosted as PWM differs too much from previous setup
+        self.hw.config.data_factory_values["uvPwm"] = 100
+        wizard = UVCalibrationWizard(self.package, False, False)
+        self.uv_meter.multiplier = 0.85
+        self._run_uv_calibration(wizard)
+        self.assertTrue(wizard.data["boost"])  # Boosted as PWM differs too much from previous setup
         self._assert_final_uv_pwm(self.hw.uv_led.parameters.min_pwm)
 
     def test_uv_calibration_no_boost_replace_display(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            self.hw.config.data_factory_values["uvPwm"] = 100
-            wizard = UVCalibrationWizard(self.package, True, False)
-            self.uv_meter.multiplier = 0.85
-            self._run_uv_calibration(wizard)
-            self.assertFalse(wizard.data["boost"])  # Not boosted despite difference from previous setup, setup changed
-
-            self.assertEqual(0, self.hw.exposure_screen.usage_s)  # Display replaced
-            self.assertEqual(6912, self.hw.uv_led.usage_s)  # UV LED stays
-            self.assertTrue(defines.counterLog.exists())  # Counter log written as display was replaced
-            with defines.counterLog.open("r") as f:
-                log = toml.load(f)
-                for data in log.values():
-                    # Log record contains original counter values
-                    self.assertEqual(6912, data["uvLed_seconds"])
-                    self.assertEqual(3600, data["display_seconds"])
+        self.hw.config.data_factory_values["uvPwm"] = 100
+        wizard = UVCalibrationWizard(self.package, True, False)
+        self.uv_meter.multiplier = 0.85
+        self._run_uv_calibration(wizard)
+        self.assertFalse(wizard.data["boost"])  # Not boosted despite difference from previous setup, setup changed
+
+        self.assertEqual(0, self.hw.exposure_screen.usage_s)  # Display replaced
+        self.assertEqual(6912, self.hw.uv_led.usage_s)  # UV LED stays
+        self.assertTrue(defines.counterLog.exists())  # Counter log written as display was replaced
+        with defines.counterLog.open("r") as f:
+            log = toml.load(f)
+            for data in log.values():
+                # Log record contains original counter values
+                self.assertEqual(6912, data["uvLed_seconds"])
+                self.assertEqual(3600, data["display_seconds"])
         self._assert_final_uv_pwm(self.hw.uv_led.parameters.min_pwm)
 
     def test_uv_calibration_boost_replace_led(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            wizard = UVCalibrationWizard(self.package, False, True)
-            self.uv_meter.multiplier = 0.75
-            self._run_uv_calibration(wizard)
-            self.assertTrue(wizard.data["boost"])  # Too weak needs boost even when changed
-
-            self.assertEqual(3600, self.hw.exposure_screen.usage_s)  # Display stays
-            self.assertEqual(0, self.hw.uv_led.usage_s)  # UV LED replaced
-            self.assertTrue(defines.counterLog.exists())  # Counter log written as UV LED was replaced
+        wizard = UVCalibrationWizard(self.package, False, True)
+        self.uv_meter.multiplier = 0.75
+        self._run_uv_calibration(wizard)
+        self.assertTrue(wizard.data["boost"])  # Too weak needs boost even when changed
+
+        self.assertEqual(3600, self.hw.exposure_screen.usage_s)  # Display stays
+        self.assertEqual(0, self.hw.uv_led.usage_s)  # UV LED replaced
+        self.assertTrue(defines.counterLog.exists())  # Counter log written as UV LED was replaced
         self._assert_final_uv_pwm(self.hw.uv_led.parameters.min_pwm)
 
     def test_uv_calibration_dim(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            wizard = UVCalibrationWizard(self.package, False, False)
-            self.uv_meter.multiplier = 0.1
-            self._run_uv_calibration(wizard, expected_state=WizardState.FAILED)
-            self.assertIsInstance(wizard.exception, UVTooDimm)
+        wizard = UVCalibrationWizard(self.package, False, False)
+        self.uv_meter.multiplier = 0.1
+        self._run_uv_calibration(wizard, expected_state=WizardState.FAILED)
+        self.assertIsInstance(wizard.exception, UVTooDimm)
         self._assert_final_uv_pwm(0)
 
     def test_uv_calibration_bright(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            wizard = UVCalibrationWizard(self.package, False, False)
-            self.uv_meter.multiplier = 10
-            self._run_uv_calibration(wizard, expected_state=WizardState.FAILED)
-            self.assertIsInstance(wizard.exception, UVTooBright)
+        wizard = UVCalibrationWizard(self.package, False, False)
+        self.uv_meter.multiplier = 10
+        self._run_uv_calibration(wizard, expected_state=WizardState.FAILED)
+        self.assertIsInstance(wizard.exception, UVTooBright)
         self._assert_final_uv_pwm(0)
 
     def test_uv_calibration_dev(self):
-        with patch("slafw.wizard.wizards.uv_calibration.UvLedMeterMulti", self.uv_meter):
-            wizard = UVCalibrationWizard(self.package, False, False)
-            self.uv_meter.noise = 70
-            self._run_uv_calibration(wizard, expected_state=WizardState.FAILED)
-            self.assertIsInstance(wizard.exception, UVDeviationTooHigh)
+        wizard = UVCalibrationWizard(self.package, False, False)
+        self.uv_meter.noise = 70
+        self._run_uv_calibration(wizard, expected_state=WizardState.FAILED)
+        self.assertIsInstance(wizard.exception, UVDeviationTooHigh)
         self._assert_final_uv_pwm(0)
 
     def _run_uv_calibration(self, wizard: UVCalibrationWizard, expected_state=WizardState.DONE):
-        def on_state_changed(state):
-            if state == WizardState.TEST_DISPLAY:
-                wizard.report_display(True)
-            if state == WizardState.UV_CALIBRATION_PREPARE:
-                wizard.uv_calibration_prepared()
-            if state == WizardState.UV_CALIBRATION_PLACE_UV_METER:
-                wizard.uv_meter_placed()
-            if state == WizardState.UV_CALIBRATION_APPLY_RESULTS:
-                wizard.uv_apply_result()
-            if state == WizardState.STOPPED:
-                wizard.abort()
-            if state == WizardState.SHOW_RESULTS:
-                wizard.show_results_done()
-
-        wizard.state_changed.connect(on_state_changed)
+        self._wire_states(wizard, {
+            WizardState.TEST_DISPLAY: lambda: wizard.report_display(True),
+            WizardState.UV_CALIBRATION_PREPARE: wizard.uv_calibration_prepared,
+            WizardState.UV_CALIBRATION_PLACE_UV_METER: wizard.uv_meter_placed,
+            WizardState.UV_CALIBRATION_APPLY_RESULTS: wizard.uv_apply_result,
+            WizardState.STOPPED: wizard.abort,
+            WizardState.SHOW_RESULTS: wizard.show_results_done,
+        })
         self._run_wizard(wizard, limit_s=15, expected_state=expected_state)
 
     def _assert_final_uv_pwm(self, expected_value: int):
@@ -809,7 +774,7 @@ class TankSurfaceCleanerTest(TestWizardsBase):
         super().setUp()
         self.hw.config.calibrated = True
         self.wizard = TankSurfaceCleaner(self.package)
-        self.wizard.state_changed.connect(self.on_state_changed)
+        self._wire_wizard()
 
         self.exposure_start_time = None
         self.exposure_end_time = None
@@ -828,13 +793,12 @@ class TankSurfaceCleanerTest(TestWizardsBase):
         del self.hw
         super().tearDown()
 
-    def on_state_changed(self, state):
-        if state == WizardState.TANK_SURFACE_CLEANER_INIT:
-            self.wizard.tank_surface_cleaner_init_done()
-        if state == WizardState.TANK_SURFACE_CLEANER_INSERT_CLEANING_ADAPTOR:
-            self.wizard.insert_cleaning_adaptor_done()
-        if state == WizardState.TANK_SURFACE_CLEANER_REMOVE_CLEANING_ADAPTOR:
-            self.wizard.remove_cleaning_adaptor_done()
+    def _wire_wizard(self):
+        self._wire_states(self.wizard, {
+            WizardState.TANK_SURFACE_CLEANER_INIT: self.wizard.tank_surface_cleaner_init_done,
+            WizardState.TANK_SURFACE_CLEANER_INSERT_CLEANING_ADAPTOR: self.wizard.insert_cleaning_adaptor_done,
+            WizardState.TANK_SURFACE_CLEANER_REMOVE_CLEANING_ADAPTOR: self.wizard.remove_cleaning_adaptor_done,
+        })
 
     def test_tank_surface_cleaner(self):
         self._run_wizard(self.wizard, limit_s=10000)
@@ -870,7 +834,7 @@ class TankSurfaceCleanerTest(TestWizardsBase):
     def test_tank_surface_cleaner_without_calibration(self):
         self.hw.config.calibrated = False
         self.wizard = TankSurfaceCleaner(self.package)
-        self.wizard.state_changed.connect(self.on_state_changed)
+        self._wire_wizard()
 
         self._run_wizard(self.wizard, limit_s=60, expected_state=WizardState.FAILED)
 
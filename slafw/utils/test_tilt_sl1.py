@@ -19,34 +19,39 @@ printer_model = PrinterModel.SL1
 hw_config = HwConfig()
 hw = HardwareSL1(hw_config, printer_model)
 
+POLL_S = 0.01
+
 hw.tilt.sync_ensure()
 hw.tilt.move(5300)
 while hw.tilt.moving:
-    sleep(0.1)
+    sleep(POLL_S)
 #endwhile
 profile = [1750, 1750, 0, 0, 58, 26, 2100]
+# only the SGT value (profile[5]) changes, serialize the rest just once
+profile_prefix = ' '.join(str(num) for num in profile[:5])
+profile_suffix = ' '.join(str(num) for num in profile[6:])
 result = {}
 for sgt in range(10, 30):
-    profile[5] = sgt
+    profile_text = f"{profile_prefix} {sgt} {profile_suffix}"
     sgbd: List[int] = []
     hw.mcc.do("!tics", 4)
-    hw.mcc.do("!ticf", ' '.join(str(num) for num in profile))
+    hw.mcc.do("!ticf", profile_text)
     hw.mcc.do("?ticf")
     hw.mcc.do("!sgbd")
     hw.tilt.move(0)
     while hw.tilt.moving:
         sgbd.extend(hw.getStallguardBuffer())
-        sleep(0.1)
+        sleep(POLL_S)
     #endwhile
     if hw.tilt.position == 0:
         avg = sum(sgbd) / float(len(sgbd))
         if 200 < avg < 250:
-            result[avg] = ' '.join(str(num) for num in profile)
+            result[avg] = profile_text
 
     hw.mcc.do("!tics", 0)
     hw.tilt.move(5300)
     while hw.tilt.moving:
-        sleep(0.1)
+        sleep(POLL_S)
     #endwhile
 
 print(result)
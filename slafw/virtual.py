@@ -13,7 +13,6 @@ a desktop computer without motion controller connected. This mode is intended fo
 """
 
 import asyncio
-import concurrent
 import logging
 import os
 import signal
@@ -46,20 +45,8 @@ from slafw.hardware.sl1.tilt_profiles import TILT_CFG_LOCAL
 from slafw.hardware.sl1.tower_profiles import TOWER_CFG_LOCAL
 from slafw.exposure.persistence import LAST_PROJECT_DATA
 from slafw.states.printer import PrinterState
-
-# gitlab CI job creates model folder in different location due to restricted permissions in Docker container
-# common path is /builds/project-0/model
 from slafw.wizard.wizards.self_test import SelfTestWizard
 
-if "CI" in os.environ:
-    defines.printer_model_run = Path(os.environ["CI_PROJECT_DIR"] + "/model")
-printer_model = PrinterModel()
-
-logging.basicConfig(format="%(asctime)s - %(levelname)s - %(name)s - %(message)s", level=logging.DEBUG)
-
-# Display warnings only once
-warnings.simplefilter("once")
-
 SAMPLES_DIR = Path(samples.__file__).parent
 SLAFW_DIR = Path(slafw.__file__).parent
 
@@ -67,6 +54,12 @@ SLAFW_DIR = Path(slafw.__file__).parent
 class Virtual:
     # pylint: disable = too-many-instance-attributes
     def __init__(self):
+        # gitlab CI job creates model folder in different location due to restricted permissions in Docker container
+        # common path is /builds/project-0/model
+        if "CI" in os.environ:
+            defines.printer_model_run = Path(os.environ["CI_PROJECT_DIR"] + "/model")
+        self.printer_model = PrinterModel()
+
         self.printer = None
         self.rauc_mocks = None
         self.glib_loop = None
@@ -106,11 +99,11 @@ class Virtual:
             patch("slafw.defines.hwConfigPathFactory", hardware_file_factory),
             patch("slafw.test_runtime.testing", True),
             patch("slafw.defines.cpuSNFile", str(SAMPLES_DIR / "nvmem")),
-            patch("slafw.defines.internalProjectPath", str(SAMPLES_DIR)),
+            patch("slafw.defines.internalProjectPath", SAMPLES_DIR),
             patch("slafw.defines.ramdiskPath", str(self.temp)),
             patch("slafw.defines.livePreviewImage", str(self.temp / "live.png")),
-            patch("slafw.defines.displayUsageData", str(self.temp / "display_usage.npz")),
-            patch("slafw.defines.serviceData", str(self.temp / "service.toml")),
+            patch("slafw.defines.displayUsageData", self.temp / "display_usage.npz"),
+            patch("slafw.defines.serviceData", self.temp / "service.toml"),
             patch("slafw.defines.statsData", self.temp / "stats.toml"),
             patch("slafw.defines.fan_check_override", True),
             patch("slafw.defines.mediaRootPath", str(SAMPLES_DIR)),
@@ -129,7 +122,7 @@ class Virtual:
             patch("slafw.defines.printer_model", self.temp / "model"),
             patch("slafw.defines.firstboot", self.temp / "firstboot"),
             patch("slafw.defines.factory_enable", self.temp / "factory_mode_enabled"),
-            patch("slafw.defines.exposure_panel_of_node", SAMPLES_DIR / "of_node" / printer_model.name.lower()),
+            patch("slafw.defines.exposure_panel_of_node", SAMPLES_DIR / "of_node" / self.printer_model.name.lower()),
             patch("slafw.defines.expoPanelLogPath", self.temp / defines.expoPanelLogFileName),
             patch("slafw.defines.http_digest_password_file", http_digest_password_file),
             patch("slafw.wizard.checks.factory_reset.ResetTimezone.reset_task_run", Mock()),
@@ -143,7 +136,7 @@ class Virtual:
             patch("distro.os_release_attr", Mock(return_value="1.8.0 blah")),
         ]
 
-        if not os.environ.get("WAYLAND_DISPLAY") or printer_model != PrinterModel.VIRTUAL:
+        if not os.environ.get("WAYLAND_DISPLAY") or self.printer_model != PrinterModel.VIRTUAL:
             patches.append(patch("slafw.hardware.exposure_screen.Wayland", WaylandMock))
 
         copyfile(SAMPLES_DIR / "hardware-virtual.cfg", hardware_file)
@@ -154,7 +147,7 @@ class Virtual:
         for p in patches:
             p.start()
 
-        set_configured_printer_model(printer_model)
+        set_configured_printer_model(self.printer_model)
         copyfile(SAMPLES_DIR / defines.expoPanelLogFileName, defines.expoPanelLogPath)
         slafw.defines.wizardHistoryPathFactory.mkdir(exist_ok=True, parents=True)
         defines.wizardHistoryPath.mkdir(exist_ok=True, parents=True)
@@ -179,50 +172,60 @@ class Virtual:
         print("Running printer")
         threading.Thread(target=self.printer_setup_body).start()  # Does not block, but requires Rauc on DBus
         self.printer.set_state(PrinterState.RUNNING)
-        self.glib_loop = GLib.MainLoop().run()
-
-        def tear_down(signum, _):
-            if signum not in [signal.SIGTERM, signal.SIGINT]:
-                return
+        self.glib_loop = GLib.MainLoop()
 
+        def tear_down():
             print("Running virtual printer tear down")
             asyncio.run(self.async_tear_down())
             print("Virtual printer teardown finished")
+            return GLib.SOURCE_REMOVE
 
-        signal.signal(signal.SIGINT, tear_down)
-        signal.signal(signal.SIGTERM, tear_down)
+        # Dispatched from the glib mainloop, not from the interrupted Python frame
+        GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGINT, tear_down)
+        GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGTERM, tear_down)
 
         print("Running glib mainloop")
-        self.glib_loop.run()  # type: ignore[attr-defined]
+        self.glib_loop.run()
 
     def printer_setup_body(self):
         self.printer.setup()
         print("Overriding printer settings")
-        self.printer.hw.config.calibrated = True
-        self.printer.hw.config.showWizard = False
-        self.printer.hw.config.fanCheck = False
-        self.printer.hw.config.coverCheck = False
-        self.printer.hw.config.resinSensor = False
+        writer = self.printer.hw.config.get_writer()
+        writer.update({
+            "calibrated": True,
+            "showWizard": False,
+            "fanCheck": False,
+            "coverCheck": False,
+            "resinSensor": False,
+        })
+        writer.commit(write=False)
 
     def fake_save_path(self):
         return Path(self.temp)
 
     async def async_tear_down(self):
-        loop = asyncio.get_running_loop()
         # Run all teardown parts in parallel. Some may block or fail
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            tasks = [
-                loop.run_in_executor(pool, self.printer.stop),
-                loop.run_in_executor(pool, self.rauc_mocks.unpublish),
-                loop.run_in_executor(pool, self.glib_loop.quit),
-                loop.run_in_executor(pool, self.printer0.unpublish),
-                loop.run_in_executor(pool, self.standard0.unpublish),
-                loop.run_in_executor(pool, self.admin0_dbus.unpublish),
-            ]
-        await asyncio.gather(*tasks)
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(part)
+                for part in (
+                    self.printer.stop,
+                    self.rauc_mocks.unpublish,
+                    self.glib_loop.quit,
+                    self.printer0.unpublish,
+                    self.standard0.unpublish,
+                    self.admin0_dbus.unpublish,
+                )
+            )
+        )
 
 
 def run_virtual():
+    logging.basicConfig(format="%(asctime)s - %(levelname)s - %(name)s - %(message)s", level=logging.DEBUG)
+
+    # Display warnings only once
+    warnings.simplefilter("once")
+
     Virtual()()
 
 
@@ -12,12 +12,14 @@ from PySignal import Signal
 from slafw.hardware.hardware import BaseHardware
 from slafw.states.wizard import WizardState
 
-@dataclass
+@dataclass(frozen=True)
 class PushState:
     state: WizardState
 
 
 class UserAction:
+    __slots__ = ["callback"]
+
     def __init__(self):
         self.callback: Optional[Callable] = None
 
@@ -4,8 +4,9 @@
 
 import json
 from datetime import datetime
+from functools import partial
 from typing import Optional
-from asyncio import sleep, gather
+from asyncio import AbstractEventLoop, Event, create_task, gather, get_running_loop, wait
 
 from slafw import defines
 from slafw.errors.errors import DisplayTestFailed
@@ -19,6 +20,8 @@ from slafw.wizard.data_package import WizardDataPackage
 
 
 class DisplayTest(DangerousCheck):
+    COVER_POLL_S = 0.1  # UV has to go off quickly once the cover is opened
+
     def __init__(self, package: WizardDataPackage):
         super().__init__(
             package,
@@ -27,6 +30,7 @@ class DisplayTest(DangerousCheck):
             [Resource.UV, Resource.TILT, Resource.TOWER_DOWN, Resource.TOWER],
         )
         self.result: Optional[bool] = None
+        self._user_event: Optional[Event] = None
 
     def reset(self):
         self.result = None
@@ -34,28 +38,32 @@ class DisplayTest(DangerousCheck):
     async def async_task_run(self, actions: UserActionBroker):
         hw = self._package.hw
         self.reset()
+        self._user_event = Event()
         await self.wait_cover_closed()
         await gather(hw.tower.verify_async(), hw.tilt.verify_async())
         old_state = False     # turn LEDs on for first time
+        # TODO: create uv_led.set_default_pwm()
+        safe_default_pwm = hw.uv_led.parameters.safe_default_pwm
         hw.start_fans()
         hw.exposure_screen.draw_pattern(draw_svg_expand, defines.prusa_logo_file, True)
         self._logger.debug("Registering display test user resolution callback")
-        actions.report_display.register_callback(self.user_callback)
+        actions.report_display.register_callback(partial(self.user_callback, get_running_loop()))
         display_check_state = PushState(WizardState.TEST_DISPLAY)
         actions.push_state(display_check_state)
+        user_reported = create_task(self._user_event.wait())
         try:
-            while self.result is None:
+            while not user_reported.done():
                 actual_state = hw.isCoverVirtuallyClosed()
                 if old_state != actual_state:
                     old_state = actual_state
                     if actual_state:
-                        # TODO: create uv_led.set_default_pwm()
-                        hw.uv_led.pwm = hw.uv_led.parameters.safe_default_pwm
+                        hw.uv_led.pwm = safe_default_pwm
                         hw.uv_led.on()
                     else:
                         hw.uv_led.off()
-                await sleep(0.1)
+                await wait({user_reported}, timeout=self.COVER_POLL_S)
         finally:
+            user_reported.cancel()
             actions.report_display.unregister_callback()
             actions.drop_state(display_check_state)
             self._logger.debug("Finishing display test")
@@ -69,9 +77,10 @@ class DisplayTest(DangerousCheck):
             # TODO: Register error for this
             raise DisplayTestFailed()
 
-    def user_callback(self, result: bool):
+    def user_callback(self, loop: AbstractEventLoop, result: bool):
         self.result = result
         self._logger.info("Use reported display status: %s", result)
+        loop.call_soon_threadsafe(self._user_event.set)
 
 
 class RecordExpoPanelLog(Check):
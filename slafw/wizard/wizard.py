@@ -9,7 +9,7 @@ from datetime import datetime
 from queue import Queue
 from shutil import copyfile
 from tempfile import NamedTemporaryFile
-from threading import Thread
+from threading import Thread, Event
 from typing import Iterable, Optional, Dict, Any
 from dataclasses import fields
 
@@ -65,6 +65,7 @@ class Wizard(Thread, UserActionBroker):
         self._data: Dict[str, Any] = {}
         self.data_changed = Signal()
         self._exception: Optional[Exception] = None
+        self.finished = Event()
 
         for check in self.checks:
             check.state_changed.connect(self.check_states_changed.emit)
@@ -104,6 +105,8 @@ class Wizard(Thread, UserActionBroker):
         if value != self.__state:
             self.__state = value
             self.state_changed.emit(value)
+            if value in WizardState.finished_states():
+                self.finished.set()
 
     @property
     def cancelable(self):